@@ -6,14 +6,19 @@
 #
 
 import argparse
+import concurrent.futures
+import fnmatch
+import os
 import re
 import shutil
 import subprocess
 
-from fnmatch import fnmatch
 from pathlib import Path
 from typing import Iterable, List, Match, Optional, Set
 
+# Maximum number of files passed to a single `ctags` process.
+CTAGS_BATCH_SIZE = 50
+
 def get_parsearg_base() -> argparse.ArgumentParser:
     """ Get base arguments for scripts generating a TF-PSA-Crypto test driver """
     parser = argparse.ArgumentParser(description="""\
@@ -113,15 +118,15 @@ class TestDriverGenerator:
         Returns:
             Set[str]: The default set of identifiers to rename.
         """
-        identifiers = set()
-        for file in self.__get_src_code_files():
-            identifiers.update(self.get_c_identifiers(file))
+        if not prefixes:
+            return set()
+        identifiers = self.get_c_identifiers_from_files(self.__get_src_code_files())
 
-        identifiers_with_prefixes = set()
-        for identifier in identifiers:
-            if any(identifier.startswith(prefix) for prefix in prefixes):
-                identifiers_with_prefixes.add(identifier)
-        return identifiers_with_prefixes
+        # One alternation tested with `match` instead of one `startswith`
+        # call per prefix and per identifier.
+        prefix_re = re.compile("|".join(map(re.escape, sorted(prefixes))))
+        return {identifier for identifier in identifiers \
+                if prefix_re.match(identifier)}
 
     def create_test_driver_tree(self, prefixes: Set[str]) -> None:
         """
@@ -186,11 +191,15 @@ class TestDriverGenerator:
         excluding the files whose basename match any of the patterns in
         `self.exclude_files`.
         """
-        out = []
-        for file in self.__get_code_files(self.src_dir):
-            if not any(fnmatch(file.name, pattern) for pattern in self.exclude_files):
-                out.append(file)
-        return out
+        if not self.exclude_files:
+            return self.__get_code_files(self.src_dir)
+
+        # Same semantics as `fnmatch.fnmatch`, with all patterns folded into a
+        # single regular expression.
+        exclude_re = re.compile("|".join(fnmatch.translate(os.path.normcase(pattern)) \
+                                         for pattern in self.exclude_files))
+        return [file for file in self.__get_code_files(self.src_dir) \
+                if not exclude_re.match(os.path.normcase(file.name))]
 
     def __get_dst_relpath(self, src_relpath: Path) -> Path:
         """
@@ -236,17 +245,44 @@ class TestDriverGenerator:
         Returns:
             Set[str]: The set of identifiers found in `file`.
         """
-        output = subprocess.check_output(
-            ["ctags", "-x", "--language-force=C", "--c-kinds=defgpstuv", str(file)],
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-        )
+        return TestDriverGenerator.get_c_identifiers_from_files([file])
+
+    @staticmethod
+    def get_c_identifiers_from_files(files: Iterable[Path]) -> Set[str]:
+        """
+        Extract the C identifiers present in any of `files` using `ctags -x`
+
+        This is equivalent to the union of `get_c_identifiers` over `files`,
+        but each `ctags` process handles a batch of `CTAGS_BATCH_SIZE` files,
+        and the batches are processed concurrently. The same symbol kinds and
+        `ctags` implementations are supported.
+
+        Returns:
+            Set[str]: The set of identifiers found in `files`.
+        """
+        paths = [str(file) for file in files]
+        batches = [paths[i:i + CTAGS_BATCH_SIZE] \
+                   for i in range(0, len(paths), CTAGS_BATCH_SIZE)]
+
         identifiers = set()
-        for line in output.splitlines():
-            identifiers.add(line.split()[0])
+        # The threads only wait for the `ctags` processes, so the GIL is not
+        # a bottleneck here.
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            for output in executor.map(TestDriverGenerator.__run_ctags, batches):
+                for line in output.splitlines():
+                    identifiers.add(line.split()[0])
 
         return identifiers
 
+    @staticmethod
+    def __run_ctags(paths: List[str]) -> str:
+        """Return the `ctags -x` cross reference of the C files `paths`."""
+        return subprocess.check_output(
+            ["ctags", "-x", "--language-force=C", "--c-kinds=defgpstuv"] + paths,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+        )
+
     def __write_test_driver_file(self, src: Path, dst: Path,
                                  headers: Set[str],
                                  identifiers_to_prefix: Set[str]) -> None:
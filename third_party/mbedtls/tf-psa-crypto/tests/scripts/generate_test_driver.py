@@ -8,11 +8,11 @@
 """
 Generate a TF-PSA-Crypto test driver
 """
-import itertools
+import functools
 import sys
 
 from pathlib import Path
-from typing import Set
+from typing import FrozenSet, Set, Tuple
 
 import scripts_path # pylint: disable=unused-import
 from mbedtls_framework import build_tree
@@ -46,6 +46,20 @@ IDENTIFIER_PREFIXES = {
 
 class TFPSACryptoTestDriverGenerator(test_driver.TestDriverGenerator):
     """ TF-PSA-Crypto test driver generator """
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def __get_header_identifiers(headers: Tuple[Tuple[str, int], ...]) -> FrozenSet[str]:
+        """
+        Return the C identifiers found in `headers`.
+
+        `headers` is a tuple of (path, modification time in nanoseconds) pairs.
+        The modification times are only part of the cache key: the headers are
+        parsed once per process, unless one of them changes between two
+        generator runs.
+        """
+        return frozenset(test_driver.TestDriverGenerator.get_c_identifiers_from_files(
+            Path(path) for path, _ in headers))
+
     def get_identifiers_to_prefix(self, prefixes: Set[str]) -> Set[str]:
         """
         Adjust the list of identifiers to prefix in the test driver code
@@ -55,11 +69,10 @@ class TFPSACryptoTestDriverGenerator(test_driver.TestDriverGenerator):
         # Get from public and core headers the identifiers that the driver
         # built-in code may reference but does not define.
         directories = ("core", "include")
-        files = itertools.chain.from_iterable(Path(directory).rglob("*.h") \
-                                              for directory in directories)
-        external_identifiers = set()
-        for file in files:
-            external_identifiers.update(self.get_c_identifiers(file))
+        headers = tuple((str(file), file.stat().st_mtime_ns) \
+                        for directory in directories \
+                        for file in sorted(Path(directory).rglob("*.h")))
+        external_identifiers = set(self.__get_header_identifiers(headers))
 
         # MBEDTLS_PRIVATE is returned as a prototype by ctags when used in
         # structure members. Just remove it.
@@ -93,9 +106,9 @@ class TFPSACryptoTestDriverGenerator(test_driver.TestDriverGenerator):
         # prefix them, especially in 'crypto_adjust_config_enable_builtins.h',
         # thus deduce them from the PSA_WANT_ ones and add them to the list of
         # identifiers to prefix in the test driver code.
-        for identifier in external_identifiers:
-            if identifier.startswith("PSA_WANT_"):
-                identifiers.add(identifier.replace("PSA_WANT_", "MBEDTLS_PSA_ACCEL_", 1))
+        identifiers.update("MBEDTLS_PSA_ACCEL_" + identifier[len("PSA_WANT_"):] \
+                           for identifier in external_identifiers \
+                           if identifier.startswith("PSA_WANT_"))
 
         return identifiers
 